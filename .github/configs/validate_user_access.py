@@ -11,10 +11,36 @@ It checks:
 - Rate limit values
 """
 
+import argparse
+import json
 import yaml
 import sys
+from collections import Counter
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Allowed values for validated fields
+VALID_TIERS = ('free', 'premium+')
+VALID_PERMISSIONS = (
+    'read', 'write', 'basic_queries', 'advanced_queries',
+    'public_data_access', 'private_data_access', 'api_access', 'analytics'
+)
+VALID_ACCESS_LEVELS = ('all', 'premium')
+
+# Sentinel for dict lookups where None is a meaningful YAML value
+_MISSING = object()
+
+# Refuse to parse anything larger than this; the real file is a few KiB
+MAX_CONFIG_SIZE = 1 << 20
+
+# Deepest collection nesting accepted. The real file nests 4 levels; building
+# much deeper documents can overflow the C stack in the libyaml loader.
+MAX_NESTING_DEPTH = 64
+
 
 def validate_access_role(role_name, role_data):
     """Validate an access role configuration"""
@@ -28,22 +54,19 @@ def validate_access_role(role_name, role_data):
 
     # Validate tier values
     if 'tier' in role_data:
-        valid_tiers = ['free', 'premium+']
-        if role_data['tier'] not in valid_tiers:
-            errors.append(f"Role '{role_name}' has invalid tier: {role_data['tier']}")
+        tier = role_data['tier']
+        if tier not in VALID_TIERS:
+            errors.append(f"Role '{role_name}' has invalid tier: {tier}")
 
     # Validate permissions is a list
     if 'permissions' in role_data:
-        if not isinstance(role_data['permissions'], list):
+        permissions = role_data['permissions']
+        if not isinstance(permissions, list):
             errors.append(f"Role '{role_name}' permissions must be a list")
         else:
             # Validate permission values against expected permissions
-            valid_permissions = [
-                'read', 'write', 'basic_queries', 'advanced_queries',
-                'public_data_access', 'private_data_access', 'api_access', 'analytics'
-            ]
-            for permission in role_data['permissions']:
-                if permission not in valid_permissions:
+            for permission in permissions:
+                if permission not in VALID_PERMISSIONS:
                     errors.append(
                         f"Role '{role_name}' has invalid permission: {permission}"
                     )
@@ -56,9 +79,10 @@ def validate_access_role(role_name, role_data):
         else:
             required_limits = ['requests_per_hour', 'concurrent_requests']
             for limit in required_limits:
-                if limit not in rate_limits:
+                value = rate_limits.get(limit, _MISSING)
+                if value is _MISSING:
                     errors.append(f"Role '{role_name}' rate_limits missing: {limit}")
-                elif not isinstance(rate_limits[limit], int) or rate_limits[limit] <= 0:
+                elif not isinstance(value, int) or value <= 0:
                     errors.append(
                         f"Role '{role_name}' rate_limits.{limit} must be "
                         f"a positive integer"
@@ -79,11 +103,11 @@ def validate_project(project, index):
 
     # Validate access_level
     if 'access_level' in project:
-        valid_levels = ['all', 'premium']
-        if project['access_level'] not in valid_levels:
+        access_level = project['access_level']
+        if access_level not in VALID_ACCESS_LEVELS:
             errors.append(
                 f"Project {index} ({project.get('id', 'unknown')}) has invalid "
-                f"access_level: {project['access_level']}"
+                f"access_level: {access_level}"
             )
 
     # Validate id format (basic check)
@@ -100,32 +124,67 @@ def validate_project(project, index):
     return errors
 
 
-def validate_config(config_path):
-    """Validate the entire configuration file"""
-    errors = []
+def exceeds_nesting_depth(stream, limit):
+    """Check whether YAML collections in stream nest deeper than limit"""
+    # Parsing to events is iterative, unlike building the document, so this
+    # is safe on any input and stops as soon as the limit is passed
+    depth = 0
+    for event in yaml.parse(stream, Loader=SafeLoader):
+        if isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+            depth += 1
+            if depth > limit:
+                return True
+        elif isinstance(event, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+            depth -= 1
+    return False
+
 
+def load_config(config_path):
+    """Read and parse the configuration file, returning (config, errors)"""
     # Check file exists
     if not config_path.exists():
-        return [f"Configuration file not found: {config_path}"]
+        return None, [f"Configuration file not found: {config_path}"]
 
-    # Parse YAML
+    # Reject oversized files before handing them to the YAML parser
+    if config_path.stat().st_size > MAX_CONFIG_SIZE:
+        return None, [
+            f"Configuration file exceeds {MAX_CONFIG_SIZE} bytes: {config_path}"
+        ]
+
+    # Parse YAML from a binary handle: the parser detects the encoding itself
+    # and error marks still name the file
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        with config_path.open('rb') as f:
+            if exceeds_nesting_depth(f, MAX_NESTING_DEPTH):
+                return None, [
+                    f"YAML parsing error: nesting deeper than "
+                    f"{MAX_NESTING_DEPTH} levels in {config_path}"
+                ]
+            f.seek(0)
+            config = yaml.load(f, Loader=SafeLoader)
+    except OSError as e:
+        return None, [f"Error reading file: {e}"]
     except yaml.YAMLError as e:
-        return [f"YAML parsing error: {e}"]
-    except Exception as e:
-        return [f"Error reading file: {e}"]
+        return None, [f"YAML parsing error: {e}"]
+    except RecursionError:
+        # The pure-Python loader recurses once per nesting level
+        return None, ["YAML parsing error: document is nested too deeply"]
+
+    return config, []
+
+
+def validate_config(config):
+    """Validate the entire parsed configuration"""
+    errors = []
 
     # Check root structure
     if not isinstance(config, dict):
         return ["Configuration must be a dictionary"]
 
-    if 'user_access' not in config:
+    user_access = config.get('user_access', _MISSING)
+    if user_access is _MISSING:
         return ["Configuration missing 'user_access' root key"]
 
-    user_access = config['user_access']
-
     # Validate access_as section
     if 'access_as' not in user_access:
         errors.append("Missing 'access_as' section")
@@ -156,46 +215,61 @@ def validate_config(config_path):
 
                 # Check for duplicate IDs
                 if 'id' in project:
-                    if project['id'] in project_ids:
-                        errors.append(f"Duplicate project ID: {project['id']}")
-                    project_ids.add(project['id'])
+                    project_id = project['id']
+                    if project_id in project_ids:
+                        errors.append(f"Duplicate project ID: {project_id}")
+                    project_ids.add(project_id)
 
     return errors
 
 
 def main():
     """Main validation function"""
+    parser = argparse.ArgumentParser(description="Validate user_access.yml configuration file")
+    parser.add_argument('--json', action='store_true',
+                        help="print a single JSON result object instead of a report")
+    args = parser.parse_args()
+
     # Find config file
     repo_root = Path(__file__).parent.parent.parent
     config_path = repo_root / '.github' / 'configs' / 'user_access.yml'
 
-    print(f"Validating: {config_path}")
-    print("-" * 60)
+    if not args.json:
+        print(f"Validating: {config_path}")
+        print("-" * 60)
 
     # Run validation
-    errors = validate_config(config_path)
+    config, errors = load_config(config_path)
+    if not errors:
+        errors = validate_config(config)
+
+    if args.json:
+        print(json.dumps({
+            'config': str(config_path),
+            'valid': not errors,
+            'errors': errors,
+        }))
+        return 1 if errors else 0
 
     if errors:
         print(f"❌ Validation failed with {len(errors)} error(s):\n")
-        for i, error in enumerate(errors, 1):
-            print(f"{i}. {error}")
+        print("\n".join(f"{i}. {error}" for i, error in enumerate(errors, 1)))
         return 1
     else:
         print("✅ Validation successful!")
         print("\nConfiguration summary:")
 
-        # Print summary
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            access_as = config['user_access']['access_as']
-            projects = config['user_access']['projects']
-
-            print(f"  - Roles defined: {', '.join(access_as.keys())}")
-            print(f"  - Projects: {len(projects)}")
-            all_count = sum(1 for p in projects if p['access_level'] == 'all')
-            premium_count = sum(1 for p in projects if p['access_level'] == 'premium')
-            print(f"  - Public projects: {all_count}")
-            print(f"  - Premium projects: {premium_count}")
+        # Print summary from the already-parsed configuration
+        access_as = config['user_access']['access_as']
+        projects = config['user_access']['projects']
+
+        print(f"  - Roles defined: {', '.join(access_as.keys())}")
+        print(f"  - Projects: {len(projects)}")
+        level_counts = Counter(p['access_level'] for p in projects)
+        all_count = level_counts['all']
+        premium_count = level_counts['premium']
+        print(f"  - Public projects: {all_count}")
+        print(f"  - Premium projects: {premium_count}")
 
         return 0
 
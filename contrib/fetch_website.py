@@ -5,11 +5,13 @@
 
 """Script to fetch content from kushmanmb.ghost.io website."""
 
+import codecs
 import sys
 import urllib.error
 import urllib.request
 
 URL = 'https://kushmanmb.ghost.io/'
+CHUNK_SIZE = 64 * 1024
 
 
 def fetch_website(url):
@@ -17,15 +19,29 @@ def fetch_website(url):
     try:
         print(f"Fetching content from {url}...")
         with urllib.request.urlopen(url, timeout=10) as response:
-            content = response.read()
-            print(f"Successfully fetched {len(content)} bytes")
-
-            # Decode and print the content
-            decoded_content = content.decode('utf-8')
             print("\n" + "="*80)
             print("Website Content:")
             print("="*80)
-            print(decoded_content)
+            sys.stdout.flush()
+
+            # Stream the body to stdout in chunks instead of buffering it all.
+            # Text-only streams (e.g. io.StringIO) have no .buffer; decode for
+            # those, incrementally so characters split across chunks survive.
+            out = getattr(sys.stdout, 'buffer', None)
+            decoder = None if out else codecs.getincrementaldecoder('utf-8')(errors='replace')
+            total = 0
+            while chunk := response.read(CHUNK_SIZE):
+                if out:
+                    out.write(chunk)
+                else:
+                    sys.stdout.write(decoder.decode(chunk))
+                total += len(chunk)
+            if out:
+                out.flush()
+            else:
+                sys.stdout.write(decoder.decode(b'', final=True))
+
+            print(f"\nSuccessfully fetched {total} bytes")
 
             return 0
 